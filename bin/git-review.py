@@ -8,6 +8,7 @@ with the specified reviewers (if any).
 """
 
 import argparse
+from concurrent import futures
 import datetime
 import functools
 import getpass
@@ -17,105 +18,139 @@ import json
 import logging
 import os
 from os import path
-import platform
 import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
 import typing
-from typing import Any, Callable, Iterator, NoReturn, Optional, Sequence, Set, TypedDict, Union
-import unicodedata
+from urllib import parse
+import zlib
+from typing import Any, Callable, Iterator, NoReturn, Optional, Sequence, Set, TypedDict, TypeVar, \
+    Union
 
-try:
+# Heavier optional modules (argcomplete, gitlab, requests) are only imported where they are needed.
+if typing.TYPE_CHECKING:
+    import gitlab
     import requests
-    from requests import exceptions
-
-    # TODO(cyrille): Update types-requests and drop this.
-    class _GetSet:
-        @typing.overload
-        def get(self, key: str, default: str = ...) -> str:
-            ...
-
-        @typing.overload
-        def get(self, key: str, default: None = None) -> Optional[str]:
-            ...
-
-        def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
-            ...
-
-        def set(self, key: str, value: str) -> None:
-            ...
-
-    class _LuccaSession(requests.Session):
-        """A connected session to the Lucca API."""
-
-        def __init__(
-                self, base_url: str, token: Optional[str], *,
-                on_refresh: Callable[['_LuccaSession'], None]) -> None:
-            super().__init__()
-            self._base_url = base_url
-            self.typed_cookies = typing.cast(_GetSet, self.cookies)
-            if token:
-                self.typed_cookies.set('authToken', token)
-            self._on_refresh = on_refresh
-
-        def get(self, url: str, **kwargs: Any) -> requests.Response:
-            url = f'{self._base_url}/{url}'
-            params: Optional[dict[str, Union[str, int]]] = kwargs.get('params')
-            try:
-                response = super().get(url, params=params)
-                response.raise_for_status()
-                return response
-            except exceptions.HTTPError:
-                LoginHTMLParser('identity/login', self).\
-                    get_token(input('Lucca login:'), getpass.getpass())
-                self._on_refresh(self)
-            return super().get(url, params=params)
-
-        def get_ooos_on(self, *, half_day_offset: int = 0) -> set[str]:
-            """Find the OoO people in a given number of half-days."""
-
-            day = datetime.datetime.now() + datetime.timedelta(days=half_day_offset / 2)
-            date = day.date().isoformat()
-            is_am = day.hour < 12
-
-            response = self.get('api/v3/leaves', params={
+
+
+# TODO(cyrille): Update types-requests and drop this.
+class _GetSet:
+    @typing.overload
+    def get(self, key: str, default: str = ...) -> str:
+        ...
+
+    @typing.overload
+    def get(self, key: str, default: None = None) -> Optional[str]:
+        ...
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        ...
+
+    def set(self, key: str, value: str) -> None:
+        ...
+
+
+@functools.lru_cache()
+def _get_requests() -> Any:
+    """The requests module, or None if it is not installed.
+
+    It takes a while to load, so it is only imported when an HTTP call is needed.
+    """
+
+    try:
+        import requests  # pylint: disable=import-outside-toplevel,redefined-outer-name
+    except ImportError:
+        return None
+    return requests
+
+
+class _LuccaSession:
+    """A connected session to the Lucca API."""
+
+    def __init__(
+            self, base_url: str, token: Optional[str], *,
+            on_refresh: Callable[['_LuccaSession'], None]) -> None:
+        self._session: 'requests.Session' = _get_requests().Session()
+        self._base_url = base_url
+        self.typed_cookies = typing.cast(_GetSet, self._session.cookies)
+        if token:
+            self.typed_cookies.set('authToken', token)
+        self._on_refresh = on_refresh
+        # Reentrant, as the login page itself is fetched with get.
+        self._login_lock = threading.RLock()
+
+    def get(self, url: str, *, can_prompt: bool = True, **kwargs: Any) -> 'requests.Response':
+        """Get a Lucca API endpoint, logging in again if needed and allowed to prompt."""
+
+        url = f'{self._base_url}/{url}'
+        params: Optional[dict[str, Union[str, int]]] = kwargs.get('params')
+        token = self.typed_cookies.get('authToken')
+        try:
+            response = self._session.get(url, params=params, timeout=_LUCCA_TIMEOUT)
+            response.raise_for_status()
+            return response
+        except _get_requests().HTTPError:
+            if not can_prompt:
+                raise
+            with self._login_lock:
+                # Concurrent calls only prompt once.
+                if self.typed_cookies.get('authToken') == token:
+                    LoginHTMLParser('identity/login', self).\
+                        get_token(input('Lucca login:'), getpass.getpass())
+                    self._on_refresh(self)
+        return self._session.get(url, params=params, timeout=_LUCCA_TIMEOUT)
+
+    def post(self, url: str, **kwargs: Any) -> 'requests.Response':
+        """Post to an absolute URL within the session."""
+
+        return self._session.post(url, timeout=_LUCCA_TIMEOUT, **kwargs)
+
+    def get_ooos_on(self, *, half_day_offset: int = 0, is_background: bool = False) -> set[str]:
+        """Find the OoO people in a given number of half-days.
+
+        In a background thread, it never prompts, and does not start any thread of its own, as
+        those would be waited for at exit.
+        """
+
+        day = datetime.datetime.now() + datetime.timedelta(days=half_day_offset / 2)
+        date = day.date().isoformat()
+        is_am = day.hour < 12
+        cache_key = f'{self._base_url} {date} {"AM" if is_am else "PM"}'
+        if (cached_ooos := _get_lucca_cache().get(cache_key)) is not None:
+            return set(cached_ooos)
+
+        fetches: tuple[Callable[[], 'requests.Response'], ...] = (
+            lambda: self.get('api/v3/leaves', can_prompt=not is_background, params={
                 'date': date,
                 'fields': 'leavePeriod.owner.mail,isAM',
                 'leavePeriod.owner.departmentId': 1,
-            })
-            response.raise_for_status()
-            absents = {
-                leave_email
-                for leave in response.json()['data']['items']
-                if leave['isAM'] == is_am
-                if (leave_email := leave['leavePeriod']['owner'].get('mail'))}
-
-            response = self.get('api/v3/userDates', params={
+            }),
+            lambda: self.get('api/v3/userDates', can_prompt=not is_background, params={
                 'date': date,
                 'fields': 'am.isOff,pm.isOff,owner.mail',
-            })
-            response.raise_for_status()
-            off_days = {
-                off_email
-                for off_day in response.json()['data']['items']
-                if off_day['am' if is_am else 'pm']['isOff']
-                if (off_email := off_day['owner'].get('mail'))}
-            return absents | off_days
-
-    LuccaSession: Optional[type['_LuccaSession']] = _LuccaSession
-except ImportError:
-    requests = None  # type: ignore
-    LuccaSession = None  # pylint: disable=invalid-name
-try:
-    import argcomplete
-except ImportError:
-    # This is not needed for the script to work.
-    argcomplete = None
-try:
-    import gitlab
-except ImportError:
-    # This is not needed when pushing to a Github repo.
-    gitlab = None
+            }))
+        leaves_response, off_days_response = \
+            [fetch() for fetch in fetches] if is_background else _gather(*fetches)
+        leaves_response.raise_for_status()
+        absents = {
+            leave_email
+            for leave in leaves_response.json()['data']['items']
+            if leave['isAM'] == is_am
+            if (leave_email := leave['leavePeriod']['owner'].get('mail'))}
+
+        off_days_response.raise_for_status()
+        off_days = {
+            off_email
+            for off_day in off_days_response.json()['data']['items']
+            if off_day['am' if is_am else 'pm']['isOff']
+            if (off_email := off_day['owner'].get('mail'))}
+        ooos = absents | off_days
+        _get_lucca_cache().set(cache_key, sorted(ooos), ttl=_TEN_MINUTES)
+        return ooos
+
 
 # TODO(cyrille): Lint, type and test.
 
@@ -123,23 +158,39 @@ except ImportError:
 _REMOTE_REPO = 'origin'
 # Slugged name for the Bayes Impact Github engineering team.
 _GITHUB_ENG_TEAM_SLUG = 'software-engineers'
-
+# Base URL for the Github REST API.
+_GITHUB_API_URL = 'https://api.github.com'
+# Config file for hub, which also holds the Github credentials.
+_HUB_CONFIG_PATH = '~/.config/hub'
+_GITHUB_CACHE_PATH = '~/.cache/git-review/github.json'
+_LUCCA_CACHE_PATH = '~/.cache/git-review/lucca.json'
+
+_ONE_WEEK = 604800
 _ONE_DAY = 86400
 _TEN_MINUTES = 600
 _ONE_MINUTE = 60
+# Seconds to wait for Lucca before giving up, so that it never hangs the script.
+_LUCCA_TIMEOUT = 10
 # Separation regex for a comma separated list.
-_COMMA_SEPARATION_REGEX = re.compile(r'\s*,\s*')
-# Chars we want to avoid in branch names.
-_FORBIDDEN_CHARS_REGEX = re.compile(r'[#\u0300-\u036f]')
-# Remote URL pattern for Gitlab repos.
-_GITLAB_URL_REGEX = re.compile(r'^git@gitlab\.com:(.*)\.git')
-# Remote URL pattern for Github repos.
-_GITHUB_URL_REGEX = re.compile(r'^git@github\.com:(.*)\.git')
+_COMMA_SEPARATION_REGEX = re.compile(r'\s*,\s*', re.ASCII)
+# Lines of a commit message listing the fixed issues, e.g. "Fix #12, #13".
+_FIX_LINE_REGEX = re.compile(r'^Fix (.*)$', re.MULTILINE)
+# Chars we want to avoid in branch names: '#' and the combining accents.
+_FORBIDDEN_CHARS_TABLE = dict.fromkeys([ord('#'), *range(0x300, 0x370)])
+# Remote URL prefix and pattern for Gitlab repos.
+_GITLAB_URL_PREFIX = 'git@gitlab.com:'
+_GITLAB_URL_REGEX = re.compile(rf'^{re.escape(_GITLAB_URL_PREFIX)}(.*)\.git')
+# Remote URL prefix and pattern for Github repos.
+_GITHUB_URL_PREFIX = 'git@github.com:'
+_GITHUB_URL_REGEX = re.compile(rf'^{re.escape(_GITHUB_URL_PREFIX)}(.*)\.git')
 # Word pattern, for slugging.
 _WORD_REGEX = re.compile(r'\w+')
+# Errors of git (through ssh or curl) that mean the remote could not be reached at all.
+_CONNECTION_ERROR_REGEX = re.compile(
+    r'Could not resolve|Connection (?:refused|timed out)|Network is unreachable|'
+    r'No route to host|Failed to connect|Operation timed out')
 # Default value for the browse action.
 _BROWSE_CURRENT = '__current__browse__'
-_IFS_REGEX = re.compile(r'[ \n]')
 _BRANCH_NAME_FORMAT = '--format=%(refname:short)'
 _MUTATION_REACT_COMMENT = '''mutation ReactComment($pullRequestId: ID!, $reaction: String!) {
   addComment(input: {body: $reaction, subjectId: $pullRequestId}) {
@@ -161,7 +212,10 @@ _QUERY_GET_PR_INFOS = '''query NodeFromUrl($pullRequestUrl: URI!) {
 
 # Whether we should print each command before running it (bash xtrace), and the prefix to use.
 _XTRACE_PREFIX: list[str] = []
-_CACHE_BUSTER: list[str] = []
+# Whether the caches (on disk, or hub's) should be bypassed.
+_IS_CACHE_DISABLED = False
+
+_T = TypeVar('_T')
 
 
 class _GitlabMRRequest(TypedDict, total=False):
@@ -179,7 +233,83 @@ class _ScriptError(ValueError):
         self._stable_message = msg
 
     def __hash__(self) -> int:
-        return sum((ord(char) - 64) * 53 ** i for i, char in enumerate(self._stable_message))
+        # Unlike the builtin string hash, it does not change between runs.
+        return zlib.crc32(self._stable_message.encode('utf-8'))
+
+    @property
+    def exit_code(self) -> int:
+        """A code for the script to exit with, stable for a given message.
+
+        It is never 0, and stays below the codes shells reserve for special meanings (126+).
+        """
+
+        return hash(self) % 125 + 1
+
+
+class _JsonCache:
+    """A small key-value cache, persisted in a JSON file, whose entries expire after a while."""
+
+    def __init__(self, file_path: str) -> None:
+        self._file_path = file_path
+        self._lock = threading.Lock()
+
+    @functools.cached_property
+    def _entries(self) -> dict[str, Any]:
+        try:
+            with open(self._file_path, encoding='utf-8') as cache_file:
+                return typing.cast(dict[str, Any], json.load(cache_file))
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Any:
+        """Get a cached value, or None if it's missing, expired or if caching is disabled."""
+
+        if _IS_CACHE_DISABLED:
+            return None
+        entry = self._entries.get(key)
+        if not entry or entry.get('expires', 0) < time.time():
+            return None
+        return entry['value']
+
+    def get_stale(self, key: str) -> Optional[dict[str, Any]]:
+        """Get a cache entry even if it has expired, e.g. to revalidate it with its ETag."""
+
+        if _IS_CACHE_DISABLED:
+            return None
+        return typing.cast(Optional[dict[str, Any]], self._entries.get(key))
+
+    def delete(self, key: str) -> None:
+        """Drop a value that is known to be outdated."""
+
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._write()
+
+    def set(self, key: str, value: Any, *, ttl: int, etag: Optional[str] = None) -> None:
+        """Cache a value for ttl seconds, and drop the expired ones.
+
+        Entries with an ETag are kept a week longer, so that they can be revalidated.
+        """
+
+        now = time.time()
+        with self._lock:
+            self._entries = {
+                other_key: entry for other_key, entry in self._entries.items()
+                if entry.get('expires', 0) + (_ONE_WEEK if 'etag' in entry else 0) >= now}
+            self._entries[key] = {'expires': now + ttl, 'value': value}
+            if etag:
+                self._entries[key]['etag'] = etag
+            self._write()
+
+    def _write(self) -> None:
+        temp_path = f'{self._file_path}.{os.getpid()}'
+        try:
+            os.makedirs(path.dirname(self._file_path), exist_ok=True)
+            with open(temp_path, 'w', encoding='utf-8') as cache_file:
+                json.dump(self._entries, cache_file)
+            os.replace(temp_path, self._file_path)
+        except OSError as error:
+            logging.debug('Unable to write the cache at %s', self._file_path, exc_info=error)
 
 
 def _xtrace(command: Sequence[str]) -> None:
@@ -188,39 +318,238 @@ def _xtrace(command: Sequence[str]) -> None:
     sys.stderr.write(
         f'{_XTRACE_PREFIX[0]} ' +
         ' '.join(
-            f"'{word}'" if _IFS_REGEX.search(word) else word
+            f"'{word}'" if ' ' in word or '\n' in word else word
             for word in command
         ) + '\n')
 
 
-def _run_git(command: list[str], *, env: Optional[dict[str, str]] = None) -> str:
+@functools.lru_cache()
+def _get_executable(command: str) -> str:
+    """Resolve a command in the PATH once, rather than on each call."""
+
+    return shutil.which(command) or command
+
+
+def _spawn_git(
+        full_command: list[str], stdout: int, env: Optional[dict[str, str]],
+        stderr: Optional[int] = None) -> 'subprocess.CompletedProcess[bytes]':
+    # With an absolute executable path and without closing file descriptors (ours are not
+    # inheritable anyway), subprocess can use posix_spawn instead of fork and exec.
+    return subprocess.run(
+        full_command, executable=_get_executable('git'), stdout=stdout, stderr=stderr,
+        check=True, env=env, close_fds=False)
+
+
+def _run_git(
+        command: list[str], *, env: Optional[dict[str, str]] = None, is_quiet: bool = False) \
+        -> str:
+    full_command = ['git'] + command
+    _xtrace(full_command)
+    # Read raw bytes and decode them once, rather than through a text wrapper on the pipe.
+    # Errors are left on stderr for the user to see, unless the failure is expected.
+    stderr = subprocess.DEVNULL if is_quiet else None
+    return _spawn_git(full_command, subprocess.PIPE, env, stderr).stdout.decode().strip()
+
+
+def _run_git_silent(command: list[str], *, env: Optional[dict[str, str]] = None) -> None:
+    """Run a git command whose output is not needed. Errors still go to stderr."""
+
     full_command = ['git'] + command
     _xtrace(full_command)
-    return subprocess.check_output(full_command, text=True, env=env).strip()
+    _spawn_git(full_command, subprocess.DEVNULL, env)
+
+
+def _exec(command: list[str], *, env: Optional[dict[str, str]] = None) -> NoReturn:
+    """Replace the current process with a command. Only use it as the very last step."""
+
+    _xtrace(command)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.execvpe(command[0], command, env if env is not None else os.environ)
+
 
+def _gather(*funcs: Callable[[], Any]) -> list[Any]:
+    """Run independent blocking calls (e.g. git processes) concurrently, and get their results."""
 
+    if not funcs:
+        return []
+    with futures.ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+        return list(executor.map(lambda func: func(), funcs))
+
+
+def _in_background(func: Callable[[], _T]) -> 'futures.Future[_T]':
+    """Start a blocking call (e.g. a network request) in a thread, to get its result later.
+
+    The thread is a daemon, so that the script does not wait for it when exiting, e.g. on errors.
+    Executor threads would be joined at exit, even after a shutdown(wait=False).
+    """
+
+    future: 'futures.Future[_T]' = futures.Future()
+
+    def _run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func())
+        except BaseException as error:  # pylint: disable=broad-except
+            future.set_exception(error)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return future
+
+
+def _batch_rev_parse(refs: list[str], *, is_quiet: bool = False) -> list[str]:
+    """Resolve several revisions or repo paths with a single git process, in the given order."""
+
+    return _run_git(['rev-parse', *refs], is_quiet=is_quiet).splitlines()
+
+
+def _is_git_dirty() -> bool:
+    """Whether tracked files have uncommitted changes, in the index or the working tree."""
+
+    return bool(_run_git(['status', '--porcelain=v2', '--untracked-files=no']))
+
+
+@functools.lru_cache()
 def _has_git_diff(base: str) -> bool:
-    try:
-        _run_git(['diff', '--quiet', base])
-        return False
-    except subprocess.CalledProcessError:
-        return True
+    """Whether the content at HEAD differs from base.
+
+    Only compares tree IDs, so it assumes the working tree has been checked to be clean.
+    Switching to a review branch keeps the same content, so the result can be kept.
+    """
+
+    head_tree, base_tree = _batch_rev_parse(['HEAD^{tree}', f'{base}^{{tree}}'])
+    return head_tree != base_tree
 
 
 # TODO(cyrille): Use tuples rather than lists.
 def _run_hub(command: list[str], *, cache: Optional[int] = None, stdin: Optional[str] = None) \
         -> str:
     final_command = ['hub'] + command
-    if cache and not _CACHE_BUSTER:
+    if cache and not _IS_CACHE_DISABLED:
         final_command.extend(['--cache', str(cache)])
     _xtrace(final_command)
-    return subprocess.check_output(final_command, text=True, input=stdin).strip()
+    try:
+        return subprocess.check_output(
+            final_command, executable=_get_executable('hub'), text=True, input=stdin,
+            close_fds=False).strip()
+    except FileNotFoundError as error:
+        # Only checked when hub is actually needed: most calls go through the Github API.
+        raise _ScriptError(
+            'hub tool is not installed, or wrongly configured.\n'
+            'Please install it with ~/.bayes-developer-setup/install.sh') from error
+
+
+@functools.lru_cache()
+def _get_hub_config() -> dict[str, str]:
+    """The values of hub's config, for its first configured host.
+
+    It is a small YAML file, only the first value of each key is kept.
+    """
+
+    config: dict[str, str] = {}
+    try:
+        with open(path.expanduser(_HUB_CONFIG_PATH), encoding='utf-8') as hub_config:
+            for line in hub_config:
+                key, sep, value = line.strip().removeprefix('- ').partition(':')
+                if sep and value.strip():
+                    config.setdefault(key.strip(), value.strip())
+    except FileNotFoundError:
+        pass
+    return config
+
+
+def _get_github_token() -> str:
+    """Find a token for the Github API, in the environment or in hub's config."""
+
+    return os.getenv('GITHUB_TOKEN') or _get_hub_config().get('oauth_token', '')
+
+
+@functools.lru_cache()
+def _get_github_session() -> Optional['requests.Session']:
+    """A session to the Github API, so that all calls share the same connection.
+
+    Returns None if requests is not installed or no token is available.
+    """
+
+    if not (requests_module := _get_requests()) or not (token := _get_github_token()):
+        return None
+    session: 'requests.Session' = requests_module.Session()
+    # Allow a few concurrent calls to reuse their connections.
+    session.mount(_GITHUB_API_URL, requests_module.adapters.HTTPAdapter(pool_maxsize=8))
+    session.headers.update({
+        'Accept': 'application/vnd.github.v3+json',
+        'Authorization': f'token {token}',
+    })
+    return session
+
+
+def _send_github_request(
+        session: 'requests.Session', method: str, api_path: str, **kwargs: Any) \
+        -> 'requests.Response':
+    url = f'{_GITHUB_API_URL}/{api_path}'
+    _xtrace([method, url])
+    response = session.request(method, url, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+def _call_github_api(
+        session: 'requests.Session', method: str, api_path: str, **kwargs: Any) -> Any:
+    return _send_github_request(session, method, api_path, **kwargs).json()
+
+
+@functools.lru_cache()
+def _get_github_cache() -> _JsonCache:
+    return _JsonCache(path.expanduser(_GITHUB_CACHE_PATH))
+
+
+@functools.lru_cache()
+def _get_lucca_cache() -> _JsonCache:
+    return _JsonCache(path.expanduser(_LUCCA_CACHE_PATH))
+
+
+def _github_api(
+        api_path: str, *, method: str = 'GET', cache: Optional[int] = None,
+        body: Optional[dict[str, Any]] = None) -> Any:
+    """Call the Github API, through a shared session if possible, or through hub otherwise.
+
+    Responses of calls with a cache TTL are kept on disk that long, like hub's --cache does.
+    Once expired, they are revalidated with their ETag: an unchanged response is not sent
+    again, and does not count in Github's rate limit.
+    """
+
+    if session := _get_github_session():
+        if not cache:
+            return _call_github_api(session, method, api_path, json=body)
+        cache_key = _get_github_cache_key(method, api_path, body)
+        if (response := _get_github_cache().get(cache_key)) is not None:
+            return response
+        stale = _get_github_cache().get_stale(cache_key)
+        http_response = _send_github_request(
+            session, method, api_path, json=body,
+            headers={'If-None-Match': stale['etag']} if stale and 'etag' in stale else None)
+        if stale and http_response.status_code == 304:
+            response = stale['value']
+        else:
+            response = http_response.json()
+        _get_github_cache().set(
+            cache_key, response, ttl=cache, etag=http_response.headers.get('ETag'))
+        return response
+    hub_command = ['api', '-X', method, api_path]
+    if body is None:
+        return json.loads(_run_hub(hub_command, cache=cache))
+    hub_command.extend(['--input', '-'])
+    return json.loads(_run_hub(hub_command, cache=cache, stdin=json.dumps(body)))
+
+
+def _get_github_cache_key(method: str, api_path: str, body: Optional[dict[str, Any]]) -> str:
+    return f'{method} {api_path} {json.dumps(body, sort_keys=True)}'
 
 
 def _graphql(query: str, *, cache: Optional[int] = None, **kwargs: str) -> dict[str, Any]:
-    kwargs['query'] = query
-    args = [arg for key, value in kwargs.items() for arg in ('-F', f'{key}={value}')]
-    return typing.cast(dict[str, Any], json.loads(_run_hub(['api', 'graphql', *args], cache=cache)))
+    return typing.cast(dict[str, Any], _github_api(
+        'graphql', method='POST', cache=cache, body={'query': query, 'variables': kwargs}))
 
 
 _GithubAPIReference = TypedDict('_GithubAPIReference', {'ref': str})
@@ -241,27 +570,52 @@ class _GithubPullRequest(typing.NamedTuple):
     reviewers: Set[str]
 
     @staticmethod
-    def _fetch_all_pages(per_page: int = 30) -> Iterator[_GithubAPIPullRequest]:
+    def _from_api(pr: _GithubAPIPullRequest) -> '_GithubPullRequest':
+        return _GithubPullRequest(
+            pr['base']['ref'], pr['head']['ref'], pr['number'],
+            {rev['login'] for rev in pr['requested_reviewers']})
+
+    @staticmethod
+    def _fetch_all_pages(project_name: str, per_page: int = 30) \
+            -> Iterator[_GithubAPIPullRequest]:
         for page in itertools.count(1):
-            page_prs = typing.cast(list[_GithubAPIPullRequest], json.loads(
-                _run_hub([
-                    'api',
-                    fr'/repos/{{owner}}/{{repo}}/pulls?per_page={per_page}&page={page}',
-                ], cache=_ONE_MINUTE)))
+            page_prs = typing.cast(list[_GithubAPIPullRequest], _github_api(
+                f'repos/{project_name}/pulls?per_page={per_page}&page={page}',
+                cache=_ONE_MINUTE))
             yield from page_prs
             if len(page_prs) < per_page:
                 break
 
     @staticmethod
     @functools.lru_cache(maxsize=None)
-    def fetch_all() -> list['_GithubPullRequest']:
-        """Get all pull requests for the current repository."""
+    def fetch_all(project_name: str) -> list['_GithubPullRequest']:
+        """Get all pull requests for the given repository."""
 
         return [
-            _GithubPullRequest(
-                pr['base']['ref'], pr['head']['ref'], pr['number'],
-                {rev['login'] for rev in pr['requested_reviewers']})
-            for pr in _GithubPullRequest._fetch_all_pages()]
+            _GithubPullRequest._from_api(pr)
+            for pr in _GithubPullRequest._fetch_all_pages(project_name)]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def fetch_for_head(project_name: str, head: str) -> list['_GithubPullRequest']:
+        """Get the pull requests opened from a branch of the repository, without listing all."""
+
+        prs = typing.cast(list[_GithubAPIPullRequest], _github_api(
+            _GithubPullRequest._get_head_api_path(project_name, head), cache=_ONE_MINUTE))
+        return [_GithubPullRequest._from_api(pr) for pr in prs]
+
+    @staticmethod
+    def forget_head(project_name: str, head: str) -> None:
+        """Drop the cached pull requests of a branch, e.g. once one was opened from it."""
+
+        _GithubPullRequest.fetch_for_head.cache_clear()
+        _get_github_cache().delete(_get_github_cache_key(
+            'GET', _GithubPullRequest._get_head_api_path(project_name, head), None))
+
+    @staticmethod
+    def _get_head_api_path(project_name: str, head: str) -> str:
+        owner = project_name.partition('/')[0]
+        return f'repos/{project_name}/pulls?head={parse.quote(f"{owner}:{head}")}'
 
 
 class LoginHTMLParser(html_parser.HTMLParser):
@@ -306,18 +660,55 @@ class LoginHTMLParser(html_parser.HTMLParser):
         return self._session.typed_cookies.get('authToken', '')
 
 
+def _normalize_config_key(key: str) -> str:
+    """Lowercase the section and variable names of a config key, as git does."""
+
+    section, unused_sep, subsection_and_name = key.partition('.')
+    subsection, sep, name = subsection_and_name.rpartition('.')
+    if not sep:
+        return f'{section.lower()}.{name.lower()}'
+    return f'{section.lower()}.{subsection}.{name.lower()}'
+
+
 class _GitConfig:
 
+    @functools.cached_property
+    def _config(self) -> dict[str, dict[str, str]]:
+        """All the config values visible from the current repo, read with a single git process.
+
+        Values are indexed by scope ('all' and 'global'), then by key.
+        """
+
+        config: dict[str, dict[str, str]] = {'all': {}, 'global': {}}
+        entries = _run_git(['config', '--list', '--null', '--show-scope']).split('\0')
+        for scope, entry in zip(entries[::2], entries[1::2]):
+            key, unused_sep, value = entry.partition('\n')
+            config['all'][key] = value
+            if scope == 'global':
+                config['global'][key] = value
+        return config
+
+    def preload(self) -> None:
+        """Read the config ahead of time, e.g. concurrently with other git commands."""
+
+        unused_config = self._config
+
     def get_config(self, key: str, *, is_global: bool = False) -> str:
         """Get a config value from git. Returns an empty string if nothing is found."""
 
-        return _run_git(
-            ['config', '--default', ''] + (['--global'] if is_global else []) + ['--get', key])
+        return self._config['global' if is_global else 'all'].get(_normalize_config_key(key), '')
 
     def set_config(self, key: str, value: str, *, is_global: bool = False) -> None:
         """Set a config value to git."""
 
-        _run_git(['config'] + (['--global'] if is_global else []) + [key, value])
+        _run_git_silent(['config'] + (['--global'] if is_global else []) + [key, value])
+        if '_config' not in self.__dict__:
+            return
+        # Keep the cached values up to date, rather than reading them all again.
+        normalized_key = _normalize_config_key(key)
+        self._config['all'][normalized_key] = value
+        if is_global:
+            self._config['global'][normalized_key] = value
 
     @property
     def engineers_team_id(self) -> str:
@@ -365,7 +756,7 @@ class _GitConfig:
 
         if _GIT_CONFIG.get_config('review.lucca.enabled') != 'true':
             return None
-        if not requests or not LuccaSession:
+        if not _get_requests():
             if not os.getenv('GIT_REVIEW_DISABLE_REQUESTS_WARNING'):
                 logging.warning(
                     'Install requests if you want to link your reviews to Lucca.\n'
@@ -375,7 +766,7 @@ class _GitConfig:
         if not base_url:
             return None
         token = self.get_config('review.lucca.token', is_global=True)
-        session = LuccaSession(
+        session = _LuccaSession(
             base_url, token, on_refresh=lambda s: setattr(self, 'lucca_session', s))
         return session
 
@@ -404,23 +795,46 @@ class _References(typing.NamedTuple):
     merge_base: str
 
 
+class _StartupRefs(typing.NamedTuple):
+    """References needed by most runs, resolved together."""
+
+    # Absolute path to the root of the working tree.
+    toplevel: str
+    # Absolute path to the .git folder.
+    git_dir: str
+    # Name of the local branch at HEAD.
+    head: str
+    # Full name of the remote HEAD reference (e.g. origin/main), empty if it's not set.
+    default: str
+
+
 # TODO(cyrille): Consider uncaching.
 @functools.lru_cache()
+def _get_startup_refs() -> _StartupRefs:
+    try:
+        # The remote HEAD may be missing, so do not show git's error for it.
+        return _StartupRefs(*_batch_rev_parse([
+            '--show-toplevel', '--absolute-git-dir',
+            '--abbrev-ref', 'HEAD', f'{_REMOTE_REPO}/HEAD'], is_quiet=True))
+    except subprocess.CalledProcessError:
+        # Let _get_default complain about the missing remote HEAD if needed.
+        toplevel, git_dir, head = _batch_rev_parse(
+            ['--show-toplevel', '--absolute-git-dir', '--abbrev-ref', 'HEAD'])
+        return _StartupRefs(toplevel, git_dir, head, '')
+
+
 def _get_head() -> str:
-    if branch := _run_git(['rev-parse', '--abbrev-ref', 'HEAD']):
+    if branch := _get_startup_refs().head:
         return branch
     raise _ScriptError('Unable to find a branch at HEAD')
 
 
-@functools.lru_cache()
 def _get_default() -> str:
-    try:
-        return _run_git(['rev-parse', '--abbrev-ref', f'{_REMOTE_REPO}/HEAD']).split('/')[1]
-    except subprocess.CalledProcessError as error:
-        raise _ScriptError(
-            'Unable to find a remote HEAD reference.\n'
-            f'Please run `git remote set-head {_REMOTE_REPO} -a` and rerun your command.'
-        ) from error
+    if default := _get_startup_refs().default:
+        return default.partition('/')[2]
+    raise _ScriptError(
+        'Unable to find a remote HEAD reference.\n'
+        f'Please run `git remote set-head {_REMOTE_REPO} -a` and rerun your command.')
 
 
 @functools.lru_cache()
@@ -431,11 +845,14 @@ def _get_existing_remote() -> Optional[str]:
 
 
 def _create_branch_for_review(merge_base: str, username: str) -> Optional[str]:
-    _run_git(['fetch'])
-    if not _has_git_diff(merge_base):
+    # The fetch is only needed to list remote branches below, so overlap it with local queries.
+    unused_fetch, has_diff, title = _gather(
+        lambda: _run_git_silent(['fetch']),
+        lambda: _has_git_diff(merge_base),
+        lambda: _run_git(['log', '-1', r'--format=%s']))
+    if not has_diff:
         # No new commit to review.
         return None
-    title = _run_git(['log', '-1', r'--format=%s'])
     prefix = f'{_REMOTE_REPO}/{username}-'
     # Create a clean branch name from the first two words of the commit message.
     branch = '-'.join(
@@ -446,7 +863,7 @@ def _create_branch_for_review(merge_base: str, username: str) -> Optional[str]:
         for b in _run_git([
             'branch', '-a', _BRANCH_NAME_FORMAT,
             '-l', f'{prefix}{branch}*',
-            '-l', f'{branch}*']).split('\n')
+            '-l', f'{branch}*']).splitlines()
         if b
     }
     if suffixes:
@@ -454,18 +871,22 @@ def _create_branch_for_review(merge_base: str, username: str) -> Optional[str]:
             f'-{counter:d}'
             for counter in itertools.count()
             if f'-{counter:d}' not in suffixes)
-    _run_git(['checkout', '-b', branch])
-    _run_git(['checkout', '-'])
-    _run_git(['reset', '--hard', merge_base])
-    _run_git(['checkout', '-'])
-    _get_head.cache_clear()
+    previous_branch = _get_head()
+    _run_git_silent(['checkout', '-b', branch])
+    if previous_branch != 'HEAD':
+        # Move the previous branch back to the merge base, without checking it out again.
+        _run_git_silent(['branch', '--force', previous_branch, merge_base])
+    _get_startup_refs.cache_clear()
     return branch
 
 
 def _get_git_branches(username: str, base: Optional[str], is_new: bool) -> _References:
     """Compute the different branch names that will be needed throughout the script."""
 
-    if _has_git_diff('HEAD'):
+    # The branch tracking config is needed right after the startup refs, so load it as well.
+    # Getting the toplevel loads the startup refs, and keeps it when they are refreshed.
+    is_dirty, *unused_results = _gather(_is_git_dirty, _get_toplevel, _GIT_CONFIG.preload)
+    if is_dirty:
         raise _ScriptError(
             'Current git status is dirty. '
             'Commit, stash or revert your changes before sending for review.')
@@ -482,7 +903,7 @@ def _get_git_branches(username: str, base: Optional[str], is_new: bool) -> _Refe
             branch = new_branch
         elif branch == default:
             # List branches in user-preferred order, without the asterisk on current branch.
-            all_branches = _run_git(['branch', '--format=%(refname:short)']).split('\n')
+            all_branches = _run_git(['branch', '--format=%(refname:short)']).splitlines()
             all_branches.remove(default)
             raise _ScriptError('branch required:\n\t%s', '\n\t'.join(all_branches))
         else:
@@ -494,20 +915,66 @@ def _get_git_branches(username: str, base: Optional[str], is_new: bool) -> _Refe
     return _References(default, branch, remote_branch, base, merge_base)
 
 
+def _get_remote_branches_containing(sha1: str) -> list[str]:
+    return [
+        remote_branch
+        for remote_branch in _run_git([
+            'for-each-ref', _BRANCH_NAME_FORMAT, '--contains', sha1,
+            f'refs/remotes/{_REMOTE_REPO}/']).splitlines()
+        if remote_branch and remote_branch != f'{_REMOTE_REPO}/HEAD']
+
+
+def _has_remote_branch(branch: str) -> bool:
+    try:
+        _run_git_silent([
+            'rev-parse', '--verify', '--quiet', f'refs/remotes/{_REMOTE_REPO}/{branch}'])
+    except subprocess.CalledProcessError:
+        return False
+    return True
+
+
+@functools.lru_cache()
+def _get_repo_cache() -> _JsonCache:
+    """A cache for values specific to the current repository."""
+
+    return _JsonCache(path.join(_get_startup_refs().git_dir, 'git-review-cache.json'))
+
+
 def _get_best_base_branch(branch: str, remote: Optional[str], default: str) -> Optional[str]:
-    """Guess on which branch the changes should be merged."""
+    """Guess on which branch the changes should be merged.
 
-    remote_branches: Optional[str] = None
-    for sha1 in _run_git(['rev-list', '--max-count=5', branch, '--']).split('\n')[1:]:
-        if remote_branches := _run_git(
-                ['branch', '-r', '--contains', sha1, '--list', f'{_REMOTE_REPO}/*']):
-            break
-    else:
+    The guess is cached for each branch tip, as the same branch is often reviewed several times.
+    A cached base branch is only used while it still exists on the remote.
+    """
+
+    tip, *sha1s = _run_git(['rev-list', '--max-count=5', branch, '--']).splitlines()
+    cache_key = f'base:{tip}:{remote or ""}:{default}'
+    cached_base = _get_repo_cache().get(cache_key)
+    if cached_base == '' or cached_base and _has_remote_branch(cached_base):
+        return typing.cast(Optional[str], cached_base or None)
+    base = _find_best_base_branch(sha1s, remote, default)
+    _get_repo_cache().set(cache_key, base or '', ttl=_ONE_DAY)
+    return base
+
+
+def _find_best_base_branch(sha1s: list[str], remote: Optional[str], default: str) \
+        -> Optional[str]:
+    if not sha1s:
         return None
-    if any(rb.endswith(f'/{default}') for rb in remote_branches.split('\n')):
+    # Most often, the parent commit is already on a remote branch: only look for it first.
+    # Otherwise, look for the remote branches containing each of the older commits all at once,
+    # and keep the ones for the most recent commit.
+    first_sha1, *older_sha1s = sha1s
+    remote_branches: Optional[list[str]] = _get_remote_branches_containing(first_sha1) or next(
+        filter(None, _gather(*(
+            functools.partial(_get_remote_branches_containing, sha1) for sha1 in older_sha1s))),
+        None)
+    if not remote_branches:
         return None
-    for remote_branch in remote_branches.split('\n'):
-        base = remote_branch.rsplit('/', 1)[-1]
+    if any(rb.endswith(f'/{default}') for rb in remote_branches):
+        return None
+    for remote_branch in remote_branches:
+        base = remote_branch.rpartition('/')[2]
         if base != remote:
             return base
     return None
@@ -516,7 +983,51 @@ def _get_best_base_branch(branch: str, remote: Optional[str], default: str) -> O
 def _cleanup_branch_name(branch: str) -> str:
     """Avoid unwanted characters in branche names."""
 
-    return _FORBIDDEN_CHARS_REGEX.sub('', unicodedata.normalize('NFD', branch))
+    if branch.isascii():
+        # No accent to strip, only the forbidden ASCII chars.
+        return branch.replace('#', '')
+    import unicodedata  # pylint: disable=import-outside-toplevel
+    return unicodedata.normalize('NFD', branch).translate(_FORBIDDEN_CHARS_TABLE)
+
+
+def _start_remote_probe() -> 'subprocess.Popen[bytes]':
+    """Start checking in the background that the remote repository can be reached.
+
+    It never prompts, so that it does not get in the way of the push's own prompts: the user's
+    transport is kept as is, but it runs without a terminal.
+    """
+
+    command = ['git', 'ls-remote', _REMOTE_REPO, 'HEAD']
+    _xtrace(command)
+    return subprocess.Popen(
+        command, executable=_get_executable('git'), env=dict(os.environ, GIT_TERMINAL_PROMPT='0'),
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+        close_fds=False, start_new_session=True)
+
+
+def _stop_remote_probe(probe: 'subprocess.Popen[bytes]') -> None:
+    """Stop checking the remote repository, when its answer is not needed anymore."""
+
+    probe.kill()
+    probe.wait()
+
+
+def _check_remote_probe(probe: 'subprocess.Popen[bytes]') -> None:
+    """Fail early if the remote repository could not be reached.
+
+    Other failures, e.g. credentials which need a prompt, are left for the push to handle.
+    """
+
+    try:
+        unused_stdout, stderr = probe.communicate(timeout=5)
+    except subprocess.TimeoutExpired:
+        # The remote is slow but may still be reachable, let the push find out.
+        _stop_remote_probe(probe)
+        return
+    if probe.returncode and _CONNECTION_ERROR_REGEX.search(stderr.decode(errors='replace')):
+        raise _ScriptError(
+            'Unable to reach the "%s" remote repository. '
+            'Check your network connection.', _REMOTE_REPO)
 
 
 def _push(refs: _References, is_forced: bool) -> None:
@@ -526,25 +1037,41 @@ def _push(refs: _References, is_forced: bool) -> None:
     if is_forced:
         command.append('-f')
     command.extend(['-u', _REMOTE_REPO, f'{refs.branch}:{refs.remote}'])
-    _run_git(command)
+    _run_git_silent(command)
 
 
 def _make_pr_message(refs: _References, reviewers: list[str]) -> str:
     """Create a message for the review request."""
 
-    message = _run_git(['log', '--format=%B', f'{_REMOTE_REPO}/{refs.base}..{refs.branch}'])
-    if hook_message := _run_git_review_hook(refs, reviewers):
-        message += f'\n\n{hook_message}'
-    return message
+    # The hook may take a while, run it alongside the log.
+    log_message, hook_message = _gather(
+        lambda: _run_git(['log', '--format=%B', f'{_REMOTE_REPO}/{refs.base}..{refs.branch}']),
+        lambda: _run_git_review_hook(refs, reviewers))
+    return '\n\n'.join(filter(None, (log_message, hook_message)))
+
+
+# The working tree does not move during a run, so keep it even when startup refs are refreshed.
+@functools.lru_cache()
+def _get_toplevel() -> str:
+    return _get_startup_refs().toplevel
+
+
+@functools.lru_cache()
+def _get_review_hook() -> Optional[str]:
+    """Path to the git-review hook of the repo, if it exists and is executable."""
+
+    hook_script = f'{_get_toplevel()}/.git-review-hook'
+    if os.access(hook_script, os.X_OK):
+        return hook_script
+    if path.exists(hook_script):
+        logging.warning('The git review hook exists but is not executable. Ignoring.')
+    return None
 
 
 def _run_git_review_hook(refs: _References, reviewers: list[str]) -> str:
     """Run the git-review hook if it exists."""
 
-    hook_script = f'{_run_git(["rev-parse", "--show-toplevel"])}/.git-review-hook'
-    if not os.access(hook_script, os.X_OK):
-        if path.exists(hook_script):
-            logging.warning('The git review hook exists but is not executable. Ignoring.')
+    if not (hook_script := _get_review_hook()):
         return ''
     _xtrace([hook_script])
     try:
@@ -570,10 +1097,13 @@ class _RemoteGitPlatform:
     def from_url(remote_url: str) -> '_RemoteGitPlatform':
         """Factory for subclasses depending on URL regex."""
 
-        if gitlab_match := _GITLAB_URL_REGEX.match(remote_url):
-            return _GitlabPlatform(gitlab_match[1])
-        if github_match := _GITHUB_URL_REGEX.match(remote_url):
+        # Check the prefixes first, to only run the regexes on the relevant platform.
+        if remote_url.startswith(_GITHUB_URL_PREFIX) and \
+                (github_match := _GITHUB_URL_REGEX.match(remote_url)):
             return _GithubPlatform(github_match[1])
+        if remote_url.startswith(_GITLAB_URL_PREFIX) and \
+                (gitlab_match := _GITLAB_URL_REGEX.match(remote_url)):
+            return _GitlabPlatform(gitlab_match[1])
         if remote_url.startswith('/'):
             return _LocalPlatform(path.basename(remote_url))
         raise NotImplementedError(f'Review platform not recognized. Remote URL is {remote_url}')
@@ -591,10 +1121,15 @@ class _RemoteGitPlatform:
         return set()
 
     def request_review(
-            self, refs: _References, reviewers: list[str], is_auto_assigned: bool = False) -> None:
-        """Ask for a review on the specific platform."""
+            self, refs: _References, reviewers: list[str], is_auto_assigned: bool = False, *,
+            existing_review: Optional['futures.Future[Optional[str]]'] = None) -> None:
+        """Ask for a review on the specific platform.
+
+        The lookup for an existing review can be given if it was started beforehand.
+        """
 
-        review_id = self._has_existing_review(refs)
+        review_id = existing_review.result() if existing_review else \
+            self.get_existing_review(refs)
         if not review_id:
             message = _make_pr_message(refs, reviewers)
             review_id = self._request_review(refs, reviewers, message)
@@ -616,17 +1151,18 @@ class _RemoteGitPlatform:
         commit_msg = _run_git(['log', branch, '-1', r'--format=%B'])
         issues = {
             issue.lstrip('#')
-            for line in commit_msg.split('\n')
-            if line.startswith('Fix ')
-            for issue in _COMMA_SEPARATION_REGEX.split(line[len('Fix '):])
+            for fixed in _FIX_LINE_REGEX.findall(commit_msg)
+            for issue in _COMMA_SEPARATION_REGEX.split(fixed)
             if issue.startswith('#')}
-        for issue in issues:
-            self._add_label(issue, '[zube]: In Review')
+        _gather(*(
+            functools.partial(self._add_label, issue, '[zube]: In Review') for issue in issues))
 
     def _add_label(self, issue_number: str, label: str) -> None:
         raise self._not_implemented('git review', ' Zube interop')
 
-    def _has_existing_review(self, refs: _References) -> Optional[str]:
+    def get_existing_review(self, refs: _References) -> Optional[str]:
+        """Find the ID of the review already opened for the remote branch, if any."""
+
         return self._get_review_number(refs.remote)
 
     def _not_implemented(self, command: str, context: str = '') -> NoReturn:
@@ -668,12 +1204,24 @@ class _GitlabPlatform(_RemoteGitPlatform):
 
     def __init__(self, project_name: str) -> None:
         super().__init__(project_name)
-        if not gitlab:
+        try:
+            # This is not needed when pushing to a Github repo.
+            import gitlab  # pylint: disable=import-outside-toplevel,redefined-outer-name
+        except ImportError as error:
             raise _ScriptError(
                 'gitlab tool is not installed, please install it:\n'
-                '  https://github.com/bayesimpact/bayes-developer-setup/blob/HEAD/gitlab-cli.md')
+                '  https://github.com/bayesimpact/bayes-developer-setup/blob/HEAD/gitlab-cli.md'
+            ) from error
         self.client = gitlab.Gitlab.from_config()
-        self.project = self.client.projects.get(project_name)
+        # Do not fetch the project itself, only its sub-resources are ever used.
+        self.project = self.client.projects.get(project_name, lazy=True)
+        self._user_ids: dict[str, list[int]] = {}
+
+    @functools.cached_property
+    def _members(self) -> dict[str, int]:
+        """IDs of the project members, by username, fetched in one go."""
+
+        return {member.username: member.id for member in self.project.members.list(all=True)}
 
     @property
     def engineers(self) -> Set[str]:
@@ -682,8 +1230,18 @@ class _GitlabPlatform(_RemoteGitPlatform):
         logging.warning('No engineers team set-up for Gitlab. Not assigning anyone.')
         return set()
 
+    def _get_user_ids(self, reviewer: str) -> list[int]:
+        if reviewer.isdigit():
+            return [int(reviewer)]
+        if reviewer in self._members:
+            return [self._members[reviewer]]
+        if reviewer not in self._user_ids:
+            self._user_ids[reviewer] = [
+                user.id for user in self.client.users.list(username=reviewer)]
+        return self._user_ids[reviewer]
+
     def _get_reviewers(self, reviewers: list[str]) -> list[int]:
-        return [user.id for r in reviewers for user in self.client.users.list(username=r)]
+        return [user_id for r in reviewers for user_id in self._get_user_ids(r)]
 
     def _get_merge_request(self, branch: str, base: Optional[str]) \
             -> Optional['gitlab.MergeRequest']:
@@ -707,7 +1265,7 @@ class _GitlabPlatform(_RemoteGitPlatform):
                 merge_request.assignee_ids.extend(users)
                 merge_request.save()
             return None
-        title, description = message.split('\n', 1)
+        title, unused_sep, description = message.partition('\n')
         mr_parameters: _GitlabMRRequest = {
             'assignee_ids': users,
             'description': description,
@@ -718,23 +1276,14 @@ class _GitlabPlatform(_RemoteGitPlatform):
         return str(self.project.merge_request.create(mr_parameters).get_id())
 
     def get_available_reviewers(self) -> Set[str]:
-        return {member.username for member in self.project.members.list()}
+        return set(self._members)
 
 
 class _GithubPlatform(_RemoteGitPlatform):
 
     _platform = 'Github'
 
-    def __init__(self, project_name: str) -> None:
-        super().__init__(project_name)
-        try:
-            _run_hub(['browse', '-u'])
-        except subprocess.CalledProcessError as error:
-            raise _ScriptError(
-                'hub tool is not installed, or wrongly configured.\n'
-                'Please install it with ~/.bayes-developer-setup/install.sh') from error
-
-    @property
+    @functools.cached_property
     def engineers(self) -> Set[str]:
         """Set of Github handles for the engineers."""
 
@@ -743,19 +1292,17 @@ class _GithubPlatform(_RemoteGitPlatform):
                 'The engineering team Github ID is not in your environment. '
                 'Please run install.sh.')
             return set()
-        members = json.loads(
-            _run_hub(['api', f'/teams/{_GIT_CONFIG.engineers_team_id}/members'], cache=_ONE_DAY))
+        members = _github_api(f'teams/{_GIT_CONFIG.engineers_team_id}/members', cache=_ONE_DAY)
         return {member['login'] for member in members} - {self.username}
 
     def get_engineers_team_id(self) -> str:
-        return str(json.loads(_run_hub(
-            ['api', f'/orgs/bayesimpact/teams/{_GITHUB_ENG_TEAM_SLUG}'], cache=_ONE_DAY))['id'])
+        return str(_github_api(
+            f'orgs/bayesimpact/teams/{_GITHUB_ENG_TEAM_SLUG}', cache=_ONE_DAY)['id'])
 
     def _add_label(self, issue_number: str, label: str) -> None:
-        _run_hub([
-            'api', r'/repos/{owner}/{repo}/issues/'
-            f'{issue_number}/labels', '--input', '-',
-        ], stdin=json.dumps({'labels': [label]}))
+        _github_api(
+            f'repos/{self.project_name}/issues/{issue_number}/labels',
+            method='POST', body={'labels': [label]})
 
     def _add_reviewers(self, refs: _References, reviewers: list[str]) -> None:
         """Add reviewers to the current Pull Request."""
@@ -765,17 +1312,14 @@ class _GithubPlatform(_RemoteGitPlatform):
         pull_number = self._get_review_number(refs.remote, refs.base)
         assignees = requested_reviewers = set(reviewers)
         if self.engineers:
-            requested_reviewers = requested_reviewers & set(self.engineers)
-        _run_hub([
-            'api', r'/repos/{owner}/{repo}/pulls/'
-            f'{pull_number}/requested_reviewers',
-            '--input', '-',
-        ], stdin=json.dumps({'reviewers': list(requested_reviewers)}))
-        _run_hub([
-            'api', r'/repos/{owner}/{repo}/issues/'
-            f'{pull_number}/assignees',
-            '--input', '-',
-        ], stdin=json.dumps({'assignees': list(assignees)}))
+            requested_reviewers = requested_reviewers & self.engineers
+        _gather(
+            lambda: _github_api(
+                f'repos/{self.project_name}/pulls/{pull_number}/requested_reviewers',
+                method='POST', body={'reviewers': sorted(requested_reviewers)}),
+            lambda: _github_api(
+                f'repos/{self.project_name}/issues/{pull_number}/assignees',
+                method='POST', body={'assignees': sorted(assignees)}))
 
     def _request_review(self, refs: _References, reviewers: list[str], message: Optional[str]) \
             -> Optional[str]:
@@ -784,43 +1328,80 @@ class _GithubPlatform(_RemoteGitPlatform):
         if not message:
             self._add_reviewers(refs, reviewers)
             return None
-        hub_command = [
-            'pull-request',
-            '-m', message,
-            '-h', refs.remote,
-            '-b', refs.base]
+        assignees = requested_reviewers = set(reviewers)
+        if reviewers and self.engineers:
+            requested_reviewers = requested_reviewers & self.engineers
+        if session := _get_github_session():
+            url = self._create_pull_request(
+                session, refs, message, assignees=assignees, reviewers=requested_reviewers)
+        else:
+            # Send the message through stdin, as it may be too long for the command line.
+            hub_command = [
+                'pull-request',
+                '-F', '-',
+                '-h', refs.remote,
+                '-b', refs.base]
+            if reviewers:
+                hub_command.extend([
+                    '-a', ','.join(assignees), '-r', ','.join(requested_reviewers)])
+            url = _run_hub(hub_command, stdin=message)
+        # The branch has a review now, so it must not look like it has none in the next minute.
+        _GithubPullRequest.forget_head(self.project_name, refs.remote)
+        logging.info(url.replace('github.com', 'reviewable.io/reviews').replace('pull/', ''))
+        return url.rpartition('/')[2]
+
+    def _create_pull_request(
+            self, session: 'requests.Session', refs: _References, message: str, *,
+            assignees: Set[str], reviewers: Set[str]) -> str:
+        """Create a pull request with the Github API, and return its URL."""
+
+        title, unused_sep, body = message.partition('\n')
+        try:
+            pull_request = _call_github_api(
+                session, 'POST', f'repos/{self.project_name}/pulls', json={
+                    'base': refs.base,
+                    'body': body.strip(),
+                    'head': refs.remote,
+                    'title': title,
+                })
+        except _get_requests().HTTPError as error:
+            raise _ScriptError(
+                'Unable to create the pull request:\n%s', error.response.text) from error
+        number = pull_request['number']
+        calls: list[Callable[[], Any]] = []
         if reviewers:
-            assignees = requested_reviewers = set(reviewers)
-            if self.engineers:
-                requested_reviewers = requested_reviewers & set(self.engineers)
-            hub_command.extend(['-a', ','.join(assignees), '-r', ','.join(requested_reviewers)])
-        output = _run_hub(hub_command)
-        logging.info(output.replace('github.com', 'reviewable.io/reviews').replace('pull/', ''))
-        return output.rsplit('/', 1)[-1]
+            calls.append(lambda: _call_github_api(
+                session, 'POST', f'repos/{self.project_name}/pulls/{number}/requested_reviewers',
+                json={'reviewers': sorted(reviewers)}))
+        if assignees:
+            calls.append(lambda: _call_github_api(
+                session, 'POST', f'repos/{self.project_name}/issues/{number}/assignees',
+                json={'assignees': sorted(assignees)}))
+        _gather(*calls)
+        return typing.cast(str, pull_request['html_url'])
 
     def get_available_reviewers(self) -> Set[str]:
-        assignees = json.loads(_run_hub(
-            ['api', r'repos/{owner}/{repo}/assignees'], cache=_TEN_MINUTES))
+        assignees = _github_api(f'repos/{self.project_name}/assignees', cache=_TEN_MINUTES)
         return {assignee.get('login', '') for assignee in assignees} - {'', self.username}
 
     def _get_review_number(self, branch: str, base: Optional[str] = None) -> Optional[str]:
         return next((
-            str(pr.number) for pr in _GithubPullRequest.fetch_all()
-            if pr.head == branch
+            str(pr.number)
+            for pr in _GithubPullRequest.fetch_for_head(self.project_name, branch)
             if not base or pr.base == base), None)
 
     @functools.cached_property
     def username(self) -> str:
         """The handle for the current Github user."""
 
-        with open(path.expanduser('~/.config/hub'), encoding='utf-8') as hub_config:
-            user_line = next(line for line in hub_config.readlines() if 'user' in line)
-        return user_line.split(':')[1].strip()
+        if not (username := _get_hub_config().get('user')):
+            raise _ScriptError('Unable to find your Github user in the hub config.')
+        return username
 
     def get_available_reviews(self) -> list[str]:
         return [
             pr.head
-            for pr in _GithubPullRequest.fetch_all()
+            for pr in _GithubPullRequest.fetch_all(self.project_name)
             if self.username in pr.reviewers]
 
     def _react_with_auto_assign(self, pr_id: str) -> None:
@@ -878,19 +1459,54 @@ def _can_review(potential: str, absentee_emails: list[str]) -> bool:
         return selected > len(absentee_emails)
 
 
-def _get_auto_reviewer() -> Optional[str]:
-    all_engineers = set(_get_platform().engineers)
+def _can_look_up_review_quietly() -> bool:
+    """Whether looking for an existing review cannot prompt, so that it can run in the background.
+
+    Only hub may prompt, for Github credentials, when the API cannot be called directly.
+    """
+
+    remote_url = _GIT_CONFIG.get_config(f'remote.{_REMOTE_REPO}.url')
+    return not remote_url.startswith(_GITHUB_URL_PREFIX) or bool(_get_github_session())
+
+
+def _get_absents_today() -> Optional[set[str]]:
+    """Emails of the people who are out of office now, according to Lucca.
+
+    It runs in the background, so it never prompts: it gives None if a login is needed.
+    """
+
+    if not (lucca_session := _GIT_CONFIG.lucca_session):
+        return set()
+    if not lucca_session.typed_cookies.get('authToken'):
+        return None
+    try:
+        return lucca_session.get_ooos_on(is_background=True)
+    except _get_requests().HTTPError:
+        return None
+
+
+def _get_auto_reviewer(absents_today: Optional[set[str]] = None) -> Optional[str]:
+    """Find the best available reviewer.
+
+    The people currently out of office can be given if they were fetched beforehand.
+    """
+
+    all_engineers = _get_platform().engineers
     if not all_engineers:
         raise _ScriptError('Unable to auto-assign a reviewer.')
+    recent_engineers = dict.fromkeys(r for r in _GIT_CONFIG.recent_reviewers if r in all_engineers)
+    # Engineers who never reviewed come first, then the least recent reviewers.
     prioritized_reviewers = [
-        r for r in list(dict.fromkeys(_GIT_CONFIG.recent_reviewers + list(all_engineers)))
-        if r in all_engineers][::-1]
+        *(all_engineers - recent_engineers.keys()), *reversed(recent_engineers)]
     if not prioritized_reviewers:
         return None
-    if not _GIT_CONFIG.lucca_session:
+    if not (lucca_session := _GIT_CONFIG.lucca_session):
         return prioritized_reviewers[0]
     for half_day_offset in itertools.count():
-        absents = _GIT_CONFIG.lucca_session.get_ooos_on(half_day_offset=half_day_offset)
+        if not half_day_offset and absents_today is not None:
+            absents = absents_today
+        else:
+            absents = lucca_session.get_ooos_on(half_day_offset=half_day_offset)
         for reviewer in prioritized_reviewers:
             reviewer_email = _GIT_CONFIG.get_config(f'review.lucca.{reviewer}')
             if reviewer_email and reviewer_email not in absents:
@@ -905,57 +1521,168 @@ def prepare_push_and_request_review(
         is_submit: bool, is_auto: bool, is_new: bool) -> None:
     """Prepare a local Change List for review."""
 
+    username = username or _get_default_username()
     if not username:
         raise _ScriptError(
             'Could not find username, most probably you need to setup an email with:\n'
             '  git config user.email <me@bayesimpact.org>')
-    refs = _get_git_branches(username, base, is_new)
-    if _has_git_diff(refs.merge_base):
+    # Check that the remote can be reached while the local branches are inspected.
+    remote_probe = _start_remote_probe()
+    try:
+        refs = _get_git_branches(username, base, is_new)
+        has_diff = _has_git_diff(refs.merge_base)
+    except BaseException:
+        _stop_remote_probe(remote_probe)
+        raise
+    if not has_diff:
+        # Nothing to push, so no need for the remote.
+        _stop_remote_probe(remote_probe)
+    # Ask Lucca who is out of office, and look for an existing review while pushing.
+    absents_today = _in_background(_get_absents_today) if is_auto else None
+    existing_review = _in_background(lambda: _get_platform().get_existing_review(refs)) \
+        if _can_look_up_review_quietly() else None
+    if has_diff:
+        _check_remote_probe(remote_probe)
         _push(refs, not is_new and _get_existing_remote() == refs.remote)
-    if is_auto:
-        reviewer = _get_auto_reviewer()
+    if absents_today:
+        reviewer = _get_auto_reviewer(absents_today.result())
         if reviewer:
             logging.info('Sending the review to "%s".', reviewer)
             reviewers.append(reviewer)
-    _get_platform().request_review(refs, reviewers, is_auto_assigned=is_auto)
+    _get_platform().request_review(
+        refs, reviewers, is_auto_assigned=is_auto, existing_review=existing_review)
     if not is_submit:
         return
-    local_sha = _run_git(['rev-parse', refs.branch])
-    remote_sha = _run_git(['rev-parse', f'{_REMOTE_REPO}/{refs.remote}'])
+    local_sha, remote_sha = _batch_rev_parse([refs.branch, f'{_REMOTE_REPO}/{refs.remote}'])
     if local_sha != remote_sha:
         raise _ScriptError(
             'Local branch is not in the same state as remote branch. Not submitting.')
-    _run_git(['submit'], env=dict(os.environ, GIT_SUBMIT_AUTO_MERGE='1'))
+    _exec(['git', 'submit'], env=dict(os.environ, GIT_SUBMIT_AUTO_MERGE='1'))
 
 
-def _get_default_username(username: str) -> str:
-    if username:
-        return username
-    if email := _GIT_CONFIG.get_config('user.email'):
-        return email.split('@')[0]
-    raise _ScriptError('Please, set your email in git config.')
+def _get_default_username() -> str:
+    return _GIT_CONFIG.get_config('user.email').partition('@')[0]
 
 
+# Commands to open a URL, by sys.platform, rather than importing the platform module.
 _OPEN_URL_COMMAND = {
-    'Darwin': 'open',
-    'Windows': 'start',
+    'darwin': 'open',
+    'win32': 'start',
 }
 
 
+def _get_review_url(branch: str) -> str:
+    """Get the review URL for a branch, keeping it a minute for repeated browsing.
+
+    It is not kept longer, as the branch name may be reused for another review.
+    """
+
+    cache_key = f'review-url:{branch}'
+    if url := _get_repo_cache().get(cache_key):
+        return typing.cast(str, url)
+    url = _get_platform().get_review_url_for(branch)
+    _get_repo_cache().set(cache_key, url, ttl=_ONE_MINUTE)
+    return url
+
+
+def _get_available_reviews() -> list[str]:
+    """List branches the user should review, keeping them a while for quick completions."""
+
+    if (reviews := _get_repo_cache().get('reviews')) is not None:
+        return typing.cast(list[str], reviews)
+    reviews = _get_platform().get_available_reviews()
+    _get_repo_cache().set('reviews', reviews, ttl=_ONE_MINUTE)
+    return reviews
+
+
+def _get_available_reviewers() -> list[str]:
+    """List the possible reviewers, keeping them a while for quick completions."""
+
+    if (reviewers := _get_repo_cache().get('reviewers')) is not None:
+        return typing.cast(list[str], reviewers)
+    reviewers = sorted(_get_platform().get_available_reviewers())
+    _get_repo_cache().set('reviewers', reviewers, ttl=_TEN_MINUTES)
+    return reviewers
+
+
 def _browse_to(branch: str) -> None:
     real_branch = _get_existing_remote() or _get_head() if branch == _BROWSE_CURRENT else branch
-    url = _get_platform().get_review_url_for(real_branch or branch)
-    open_command = _OPEN_URL_COMMAND.get(platform.system(), 'xdg-open')
-    _xtrace(open_command)
+    url = _get_review_url(real_branch or branch)
+    open_command = _OPEN_URL_COMMAND.get(sys.platform, 'xdg-open')
     try:
-        subprocess.check_output([open_command, url])
+        _exec([open_command, url])
     except FileNotFoundError:
         logging.error('Unable to open URL %s', url)
         raise
 
 
-def main(string_args: Optional[list[str]] = None) -> None:
-    """Parse CLI arguments and run the script."""
+# Values of the CLI options when none is given.
+_DEFAULT_ARGS: dict[str, Any] = {
+    'auto': False,
+    'base': None,
+    'browse': None,
+    'cache': True,
+    'force': False,
+    'new': False,
+    'submit': False,
+    'username': '',
+    'xtrace': None,
+}
+# Warning for users still using the --force option.
+_FORCE_DEPRECATION_MESSAGE = (
+    'The --force (-f) option is now deprecated. '
+    'The force option of the push is now determined by the current git state.')
+# Boolean flags that can be read without building the parser, with the value they set.
+_SIMPLE_FLAGS: dict[str, tuple[str, bool]] = {
+    '-a': ('auto', True),
+    '--auto': ('auto', True),
+    '-n': ('new', True),
+    '--new': ('new', True),
+    '-s': ('submit', True),
+    '--submit': ('submit', True),
+    '--no-cache': ('cache', False),
+}
+
+
+def _parse_args(string_args: Optional[list[str]]) -> argparse.Namespace:
+    """Parse CLI arguments, without building the whole parser for the most common ones."""
+
+    if string_args is None:
+        string_args = sys.argv[1:]
+    # Only the unambiguous shape "reviewers... flags..." is read here: argparse handles the rest,
+    # including reviewers given after a flag.
+    num_reviewers = next(
+        (index for index, arg in enumerate(string_args) if arg.startswith('-')), len(string_args))
+    reviewers, flags = string_args[:num_reviewers], string_args[num_reviewers:]
+    if not os.getenv('_ARGCOMPLETE') and all(flag in _SIMPLE_FLAGS for flag in flags):
+        args = argparse.Namespace(**_DEFAULT_ARGS)
+        args.reviewers = reviewers
+        for flag in flags:
+            setattr(args, *_SIMPLE_FLAGS[flag])
+        return args
+    parser = _get_parser()
+    if argcomplete := _get_argcomplete():
+        argcomplete.autocomplete(parser)
+    return parser.parse_args(string_args)
+
+
+@functools.lru_cache()
+def _get_argcomplete() -> Any:
+    """The argcomplete module, only when the shell asks for completions and it is installed."""
+
+    if not os.getenv('_ARGCOMPLETE'):
+        return None
+    try:
+        import argcomplete  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # This is not needed for the script to work.
+        return None
+    return argcomplete
+
+
+@functools.lru_cache()
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the full CLI parser once."""
 
     # TODO(cyrille): Do not auto-complete on mutually exclusive args (reviewers, auto, browse).
     parser = argparse.ArgumentParser(description='Start a review for your change list.')
@@ -981,7 +1708,7 @@ def main(string_args: Optional[list[str]] = None) -> None:
     parser.add_argument('-s', '--submit', action='store_true', help='''
         Ask GitHub to auto-merge the branch, when all conditions are satisfied.
         Runs 'git submit'.''')
-    parser.add_argument('-u', '--username', type=_get_default_username, default='', help='''
+    parser.add_argument('-u', '--username', default='', help='''
         Set the prefix for the remote branch to USER.
         Default is username from the git user's email (such as in username@example.com)''')
     # TODO(cyrille): Auto-complete.
@@ -994,27 +1721,30 @@ def main(string_args: Optional[list[str]] = None) -> None:
         Open the review in a browser window.
         Defaults to the remote branch attached to the current branch.''',
         nargs='?', const=_BROWSE_CURRENT)
-    if argcomplete:
-        setattr(
-            reviewer_action, 'completer', lambda **kw: _get_platform().get_available_reviewers())
+    if argcomplete := _get_argcomplete():
+        setattr(reviewer_action, 'completer', lambda **kw: _get_available_reviewers())
         setattr(force_action, 'completer', argcomplete.SuppressCompleter())
-        setattr(browse_action, 'completer', lambda **kw: _get_platform().get_available_reviews())
-        argcomplete.autocomplete(parser)
-    args = parser.parse_args(string_args)
-    # TODO(cyrille): Update log level depending on required verbosity.
-    logging.basicConfig(level=logging.INFO)
-    if not args.cache:
-        _CACHE_BUSTER.append('busted')
-    if args.force:
-        logging.warning(
-            'The --force (-f) option is now deprecated. '
-            'The force option of the push is now determined by the current git state.')
+        setattr(browse_action, 'completer', lambda **kw: _get_available_reviews())
+    return parser
+
+
+def main(string_args: Optional[list[str]] = None) -> None:
+    """Parse CLI arguments and run the script."""
+
+    global _IS_CACHE_DISABLED  # pylint: disable=global-statement
+    args = _parse_args(string_args)
+    _IS_CACHE_DISABLED = not args.cache
     if args.xtrace:
         del _XTRACE_PREFIX[:]
         _XTRACE_PREFIX.append(args.xtrace)
     if args.browse:
+        # Only warnings and errors can be logged here, no need to set up logging.
         _browse_to(args.browse)
         return
+    # TODO(cyrille): Update log level depending on required verbosity.
+    logging.basicConfig(level=logging.INFO)
+    if args.force:
+        logging.warning(_FORCE_DEPRECATION_MESSAGE)
     prepare_push_and_request_review(
         username=args.username, base=args.base, reviewers=args.reviewers,
         is_submit=args.submit, is_auto=args.auto, is_new=args.new)
@@ -1024,6 +1754,5 @@ if __name__ == '__main__':
     try:
         main()
     except _ScriptError as error:
-        print(error)
-        # TODO(cyrille): Make sure that those are distinct.
-        sys.exit(hash(error))
+        sys.stderr.write(f'{error}\n')
+        sys.exit(error.exit_code)
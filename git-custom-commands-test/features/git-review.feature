@@ -17,3 +17,25 @@ Feature: git review
     And the "username-whatever" git branch in "origin" should exist
     And the "main" git branch should be in sync with "main" in "origin"
     And the file "successful submission" should exist
+
+  Scenario: Review again after the base branch was deleted
+    Given a dummy git repo in "origin"
+    And I am in a "work" git repo cloned from "origin"
+    And I create a "feature-y" git branch from "origin/main"
+    And I commit a file "feature" with message "feature y" and content:
+      """
+      Feature
+      """
+    And I successfully run `git push --quiet origin feature-y`
+    And I create a "my-change" git branch from "feature-y"
+    And I commit a file "change" with message "my change" and content:
+      """
+      Change
+      """
+    And I successfully run `git review`
+    And I successfully run `git review`
+    And I successfully run `git push --quiet origin --delete feature-y`
+    And I successfully run `git fetch --quiet --prune`
+    When I run `git review`
+    Then the exit status should be 0
+    And the "username-my-change" git branch in "origin" should exist